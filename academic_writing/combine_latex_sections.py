@@ -26,6 +26,7 @@ Arguments:
 """
 
 import argparse
+import io
 import os
 import re
 
@@ -33,12 +34,15 @@ import re
 DEFAULT_INPUT_TEX = "main.tex"
 DEFAULT_OUTPUT_TEX = "main-expanded.tex"
 
+_INPUT_RE = re.compile(r"\\input\{([^}]+)\}")
+_BEGIN_DOC_RE = re.compile(r"\\begin\{document\}")
+
 
 def get_file_content(tex_path):
     """Get the content of a LaTeX file or a comment if the file is not found."""
     try:
         # LaTeX allows omitting the .tex extension
-        if not os.path.exists(tex_path) and not tex_path.endswith(".tex"):
+        if not tex_path.endswith(".tex") and not os.path.exists(tex_path):
             tex_path += ".tex"
         with open(tex_path, encoding="utf-8") as f:
             return f.read()
@@ -46,64 +50,86 @@ def get_file_content(tex_path):
         return f"% Could not include: {tex_path} (file not found)\n"
 
 
-def expand_recursive(content, base_dir):
-    """Recursively expand \\input commands in the content."""
-    input_pattern = re.compile(r"\\input\{([^}]+)\}")
+def write_expanded(content, base_dir, out, start=0):
+    """Write content[start:] to out, recursively expanding \\input commands in place."""
+    pos = start
+    for match in _INPUT_RE.finditer(content, start):
+        out.write(content[pos:match.start()])
+        pos = match.end()
 
-    def replace_match(match):
         input_file = match.group(1).strip()
         # Resolve path relative to the current file's directory
         resolved_path = os.path.join(base_dir, input_file)
-        if not os.path.exists(resolved_path) and not resolved_path.endswith(".tex"):
+        if not resolved_path.endswith(".tex") and not os.path.exists(resolved_path):
             resolved_path += ".tex"
-        
-        new_base_dir = os.path.dirname(os.path.abspath(resolved_path))
-        
+
+        # base_dir is already absolute when coming from process_tex_file
+        new_base_dir = os.path.dirname(resolved_path)
+
         inner_content = get_file_content(resolved_path)
         if inner_content.startswith("% Could not include"):
-            return inner_content
+            out.write(inner_content)
+            continue
 
         # Recurse into the included file's content
-        expanded_inner = expand_recursive(inner_content, new_base_dir)
-        
-        return (
-            f"\n% --- Begin {input_file} ---\n"
-            f"{expanded_inner}"
-            f"\n% --- End {input_file} ---\n"
-        )
+        out.write(f"\n% --- Begin {input_file} ---\n")
+        write_expanded(inner_content, new_base_dir, out)
+        out.write(f"\n% --- End {input_file} ---\n")
 
-    return input_pattern.sub(replace_match, content)
+    out.write(content[pos:])
+
+
+def expand_recursive(content, base_dir):
+    """Recursively expand \\input commands in the content."""
+    out = io.StringIO()
+    write_expanded(content, base_dir, out)
+    return out.getvalue()
 
 
-def process_tex_file(tex_path):
-    """Process a LaTeX file and expand all \\input commands after \\begin{document}."""
+def read_tex_file(tex_path):
+    """Read a LaTeX file, returning its content and its absolute directory."""
     full_path = os.path.abspath(tex_path)
-    base_dir = os.path.dirname(full_path)
-    
     with open(full_path, encoding="utf-8") as f:
-        content = f.read()
+        return f.read(), os.path.dirname(full_path)
 
+
+def write_document(content, base_dir, out):
+    """Write a LaTeX document to out, expanding \\input commands after \\begin{document}."""
     # Split into preamble and body at \begin{document}
-    doc_start_pattern = re.compile(r"\\begin\{document\}")
-    match = doc_start_pattern.search(content)
-    
+    match = _BEGIN_DOC_RE.search(content)
+
     if not match:
         # If no \begin{document} found, process the whole file (might be a fragment)
-        return expand_recursive(content, base_dir)
-    
-    preamble = content[:match.end()]
-    body = content[match.end():]
-    
-    expanded_body = expand_recursive(body, base_dir)
-    
-    return preamble + expanded_body
+        write_expanded(content, base_dir, out)
+    else:
+        out.write(content[:match.end()])
+        write_expanded(content, base_dir, out, match.end())
+
+
+def process_tex_file(tex_path, out=None):
+    """
+    Process a LaTeX file and expand all \\input commands after \\begin{document}.
+
+    The expanded document is streamed to out, a writable text file object, when
+    given; otherwise it is built in memory and returned as a string.
+    """
+    content, base_dir = read_tex_file(tex_path)
+
+    if out is not None:
+        write_document(content, base_dir, out)
+        return None
+
+    buffer = io.StringIO()
+    write_document(content, base_dir, buffer)
+    return buffer.getvalue()
 
 
 def convert_pagebreaks_for_pandoc(content):
     """Replace \\newpage and \\clearpage with PANDOCPAGEBREAK."""
-    content = re.sub(r"\\newpage", "PANDOCPAGEBREAK", content)
-    content = re.sub(r"\\clearpage", "PANDOCPAGEBREAK", content)
-    return content
+    # Plain substrings, so str.replace avoids the regex engine entirely
+    return content.replace("\\newpage", "PANDOCPAGEBREAK").replace(
+        "\\clearpage", "PANDOCPAGEBREAK"
+    )
 
 
 def parse_arguments():
@@ -134,9 +160,17 @@ def parse_arguments():
 
 if __name__ == "__main__":
     args = parse_arguments()
-    result = process_tex_file(args.input)
+    # Read the input before opening the output, so a missing input leaves no
+    # empty output behind and the input may also be the output file
+    content, base_dir = read_tex_file(args.input)
     if args.convertpandoc:
-        result = convert_pagebreaks_for_pandoc(result)
-    with open(args.output, "w", encoding="utf-8") as f:
-        f.write(result)
+        buffer = io.StringIO()
+        write_document(content, base_dir, buffer)
+        result = convert_pagebreaks_for_pandoc(buffer.getvalue())
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            # Stream the expansion straight to disk
+            write_document(content, base_dir, f)
     print(f"Expanded LaTeX written to {args.output}")
@@ -39,7 +39,8 @@ Supported Commands:
 
     \\printacronyms[include=abbrev, heading=none]
                 - Replaced with a formatted list of all acronyms used in the document,
-                  sorted alphabetically by short form. Each entry is formatted as:
+                  sorted alphabetically by short form (options are ignored, and the
+                  list may appear before the acronyms are used). Each entry is formatted as:
                   "\\textbf{SHORT}, Long Form"
 
 Acronym File Format:
@@ -71,6 +72,70 @@ Examples:
 import argparse
 import re
 
+# Each \DeclareAcronym{key}{body} block, where body ends with a } on its own line
+_DECLARE_RE = re.compile(r"\\DeclareAcronym\{([^}]+)\}\s*\{(.*?)\r?\n\s*\}", re.DOTALL)
+# Fields within a \DeclareAcronym block
+_SHORT_RE = re.compile(r"short\s*=\s*\{([^}]+)\}")
+_LONG_RE = re.compile(r"long\s*=\s*\{([^}]+)\}")
+# LaTeX acronym commands such as \acp{...}, \ac{...}, etc., or a \printacronyms
+# command (with optional [...] options) in the third group
+_AC_RE = re.compile(
+    r"\\([aA]c[sfl]?p?)\{([^}]+)\}|(\\printacronyms(?![A-Za-z@])(?:\[[^\]]*\])?)"
+)
+# Stands in for \printacronyms until the set of used acronyms is known
+_PRINT_SENTINEL = "\x00PRINTACRONYMS\x00"
+
+
+def _capitalize_first(s):
+    """Uppercase the first character only, leaving the rest (e.g. NASA) intact."""
+    return s[:1].upper() + s[1:]
+
+
+def _make_formatter(form, is_plural, is_caps):
+    """Build a (short, long) -> str formatter for one acronym command form."""
+    suffix = "s" if is_plural else ""
+    case = _capitalize_first if is_caps else str
+    if form == "short":
+        return lambda short, long: case(short + suffix)
+    if form == "long":
+        return lambda short, long: case(long + suffix)
+    return lambda short, long: f"{case(long + suffix)} ({case(short + suffix)})"
+
+
+# Acronym command -> (form, plural, capitalize, marks_seen); the "default" form
+# is the full form on first use and the short form thereafter
+_CMD_TABLE = {
+    "ac": ("default", False, False, True),
+    "Ac": ("default", False, True, True),
+    "acp": ("default", True, False, True),
+    "Acp": ("default", True, True, True),
+    "acf": ("full", False, False, True),
+    "Acf": ("full", False, True, True),
+    "acfp": ("full", True, False, True),
+    "Acfp": ("full", True, True, True),
+    "acl": ("long", False, False, False),
+    "Acl": ("long", False, True, False),
+    "aclp": ("long", True, False, False),
+    "Aclp": ("long", True, True, False),
+    "acs": ("short", False, False, True),
+    "Acs": ("short", False, True, True),
+    "acsp": ("short", True, False, True),
+    "Acsp": ("short", True, True, True),
+}
+
+# Formatters for the first use of an acronym and for every use after that
+_FIRST_USE_FMT = {
+    command: _make_formatter("full" if form == "default" else form, plural, caps)
+    for command, (form, plural, caps, _) in _CMD_TABLE.items()
+}
+_SUBSEQUENT_FMT = {
+    command: _make_formatter("short" if form == "default" else form, plural, caps)
+    for command, (form, plural, caps, _) in _CMD_TABLE.items()
+}
+_MARKS_SEEN = frozenset(
+    command for command, (_, _, _, marks_seen) in _CMD_TABLE.items() if marks_seen
+)
+
 
 def read_acronyms(file_path) -> dict:
     """
@@ -80,23 +145,13 @@ def read_acronyms(file_path) -> dict:
     with open(file_path, "r") as file:
         content = file.read()
 
-    # Find each \DeclareAcronym block
-    # We look for \DeclareAcronym{key}{body} where body ends with a } on its own line or followed by whitespace
-    block_pattern = re.compile(
-        r"\\DeclareAcronym\{([^}]+)\}\s*\{(.*?)\r?\n\s*\}", re.DOTALL
-    )
-
-    # Patterns for fields within a block
-    short_pattern = re.compile(r"short\s*=\s*\{([^}]+)\}")
-    long_pattern = re.compile(r"long\s*=\s*\{([^}]+)\}")
-
     acronyms = {}
-    for match in block_pattern.finditer(content):
+    for match in _DECLARE_RE.finditer(content):
         key = match.group(1).strip()
         body = match.group(2)
 
-        short_match = short_pattern.search(body)
-        long_match = long_pattern.search(body)
+        short_match = _SHORT_RE.search(body)
+        long_match = _LONG_RE.search(body)
 
         if short_match and long_match:
             acronyms[key] = {
@@ -110,66 +165,46 @@ def read_acronyms(file_path) -> dict:
 def replace_acronyms(text, acronyms) -> tuple[str, set]:
     """
     Replaces LaTeX-style acronym commands in a text with their definitions.
-    """
-
-    def capitalize_first(s):
-        if not s:
-            return s
-        return s[0].upper() + s[1:]
-
-    def get_replacement(command, key, seen_acronyms):
-        short = acronyms[key]["short"]
-        long = acronyms[key]["long"]
-        cmd_upper = command.upper()
 
-        is_plural = cmd_upper.endswith("P")
-        is_caps = command[0].isupper()
-
-        s_suffix = "s" if is_plural else ""
-
-        # Determine base forms
-        short_form = f"{short}{s_suffix}"
-        long_form = f"{long}{s_suffix}"
-        if is_caps:
-            long_form = capitalize_first(long_form)
-            short_form = capitalize_first(short_form)
+    Any \\printacronyms command is replaced in the same pass with the list of
+    acronyms used anywhere in the text (see generate_acronym_list).
+    """
+    # Skip the regex pass entirely for text without any acronym commands
+    if "\\ac" not in text and "\\Ac" not in text and "\\printacronyms" not in text:
+        return text, set()
 
-        full_form = f"{long_form} ({short_form})"
+    seen_acronyms = set()
+    has_print = False
 
-        # 1. Force short form: \acs, \acsp
-        if "ACS" in cmd_upper:
-            seen_acronyms.add(key)
-            return short_form
+    def re_replace(match):
+        nonlocal has_print
+        command = match.group(1)
+        if command is None:
+            # \printacronyms may precede some uses, so fill it in after the pass
+            has_print = True
+            return _PRINT_SENTINEL
 
-        # 2. Force long form: \acl, \aclp
-        if "ACL" in cmd_upper:
-            return long_form
+        key = match.group(2)
+        entry = acronyms.get(key)
+        if entry is None:
+            return match.group(0)
 
-        # 3. Force full form: \acf, \acfp
-        if "ACF" in cmd_upper:
-            seen_acronyms.add(key)
-            return full_form
+        fmt_table = _SUBSEQUENT_FMT if key in seen_acronyms else _FIRST_USE_FMT
+        fmt = fmt_table.get(command)
+        if fmt is None:
+            return match.group(0)
 
-        # 4. Standard: \ac, \acp
-        if key not in seen_acronyms:
+        # seen_acronyms is shared with the enclosing call and updated in place
+        if command in _MARKS_SEEN:
             seen_acronyms.add(key)
-            return full_form
-        else:
-            return short_form
-
-    # Regex pattern matches LaTeX-like commands like: \acp{...}, \ac{...}, etc.
-    pattern = r"\\([aA]c[sfl]?p?)\{([^}]+)\}"
-
-    seen_acronyms = set()
 
-    def re_replace(match):
-        command = match.group(1)
-        key = match.group(2)
-        if key in acronyms:
-            return get_replacement(command, key, seen_acronyms)
-        return match.group(0)
+        return fmt(entry["short"], entry["long"])
 
-    processed_text = re.sub(pattern, re_replace, text)
+    processed_text = _AC_RE.sub(re_replace, text)
+    if has_print:
+        processed_text = processed_text.replace(
+            _PRINT_SENTINEL, generate_acronym_list(seen_acronyms, acronyms)
+        )
     return processed_text, seen_acronyms
 
 
@@ -190,16 +225,12 @@ def generate_acronym_list(seen_acronyms: set, acronyms: dict) -> str:
 
     # Sort alphabetically by short form
     used = sorted(
-        [(acronyms[key]["short"], acronyms[key]["long"]) for key in seen_acronyms],
+        ((acronyms[key]["short"], acronyms[key]["long"]) for key in seen_acronyms),
         key=lambda x: x[0].lower(),
     )
 
     # Format as a list
-    lines = []
-    for short, long in used:
-        lines.append(f"\\textbf{{{short}}}, {long}")
-
-    return "\n\n".join(lines)
+    return "\n\n".join(f"\\textbf{{{short}}}, {long}" for short, long in used)
 
 
 def main():
@@ -242,14 +273,8 @@ Examples:
     with open(args.input, "r") as f:
         text = f.read()
 
-    # Process acronyms
-    processed_text, seen_acronyms = replace_acronyms(text, acronyms)
-
-    # Generate the acronym list and replace \printacronyms
-    acronym_list = generate_acronym_list(seen_acronyms, acronyms)
-    processed_text = processed_text.replace(
-        r"\printacronyms[include=abbrev, heading=none]", acronym_list
-    )
+    # Process acronyms and \printacronyms
+    processed_text, _ = replace_acronyms(text, acronyms)
 
     # Write output
     with open(args.output, "w") as f:
@@ -11,7 +11,8 @@ libraries that contain ALL references, but you only want to include those
 that are cited in your LaTeX project.
 
 Features:
-- Recursively scans all .tex files in a directory for \\cite{} commands
+- Recursively scans all .tex files in a directory for \\cite{} commands and
+  their natbib/biblatex variants (\\citep, \\parencite, \\textcite, \\autocite, ...)
 - Handles multiple citations within a single \\cite{key1, key2, key3} command
 - Filters out unwanted BibTeX fields (e.g., abstract, file, url, keywords)
 - Warns about citation keys that are not found in the .bib file
@@ -40,8 +41,43 @@ Example Workflow:
 """
 
 import argparse
+import os
 import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Match \cite, \citep, \citet, \citeauthor, \citeyear, etc., the biblatex
+# \parencite/\textcite/\autocite/\footcite families and \nocite, with optional
+# starred forms and [pre][post] note arguments
+_CITE_RE = re.compile(
+    r"\\(?:[Cc]ite|[Pp]arencite|[Tt]extcite|[Aa]utocite|[Ff]ootcite|nocite)[a-z]*"
+    r"\*?(?:\[[^\]]*\])*\{([^}]+)\}"
+)
+# Within an entry: a brace (every brace counts, as in BibTeX), or the start of
+# a field line (e.g., "\n  author = ") capturing its name, which may contain
+# hyphens (as in "mendeley-tags"). A JabRef-style OPT/ALT prefix (as in
+# "OPTurl") is not part of the captured name.
+_FIELD_TOKEN_RE = re.compile(
+    r"([{}])|\n[ \t]*(?:(?:OPT|ALT)(?=[a-z]))?([\w-]+)[ \t]*="
+)
+# Opening of a BibTeX entry (e.g., "@article{smith2020,"), capturing type and key
+_ENTRY_HEAD_RE = re.compile(r"@(\w+)\s*\{\s*([^,\s]+)\s*,")
+# Braces, used to find where an entry's body closes. Like BibTeX, every brace
+# counts, including ones preceded by a backslash.
+_BRACE_RE = re.compile(r"[{}]")
+
+
+def _iter_tex_files(tex_directory):
+    """Yield the path of every .tex file under tex_directory, recursively."""
+    for dirpath, _dirnames, filenames in os.walk(tex_directory):
+        for name in filenames:
+            if name.endswith(".tex"):
+                yield os.path.join(dirpath, name)
+
+
+def _scan_tex_file(tex_file):
+    """Return the raw \\cite{} argument strings found in a single .tex file."""
+    with open(tex_file, "r", encoding="utf-8") as f:
+        return _CITE_RE.findall(f.read())
 
 
 def extract_citations_from_tex_files(tex_directory="."):
@@ -69,21 +105,21 @@ def extract_citations_from_tex_files(tex_directory="."):
     Note:
       - Only processes files with .tex extension
       - Uses UTF-8 encoding when reading files
-      - Citation keys are extracted from \cite{key1,key2,...} patterns
+      - Citation keys are extracted from \cite{key1,key2,...} patterns,
+        including variants such as \citep, \parencite and \cite[p. 3]{key}
+      - \nocite{*} yields the key "*", meaning every entry in the .bib file
       - Whitespace around citation keys is automatically stripped
       - Recursively searches through all subdirectories
+      - Files are read concurrently using a thread pool
     """
     citations = set()
-    tex_files = Path(tex_directory).rglob("*.tex")
+    tex_files = _iter_tex_files(tex_directory)
 
-    for tex_file in tex_files:
-        with open(tex_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            # Match \cite, \citep, \citet, \citeauthor, \citeyear, etc.
-            cite_matches = re.findall(r"\\cite[a-z]*\*?\{([^}]+)\}", content)
+    # Reading is I/O-bound, so overlap the file reads across a thread pool
+    with ThreadPoolExecutor() as executor:
+        for cite_matches in executor.map(_scan_tex_file, tex_files):
             for match in cite_matches:
-                keys = [key.strip() for key in match.split(",")]
-                citations.update(keys)
+                citations.update(key.strip() for key in match.split(","))
 
     return citations
 
@@ -91,41 +127,150 @@ def extract_citations_from_tex_files(tex_directory="."):
 def filter_entry_fields(entry_text, excluded_fields):
     """
     Remove specified fields from a BibTeX entry, including multi-line fields.
+
+    Field names are matched case-insensitively, ignoring a leading OPT/ALT
+    prefix (so excluding "url" also drops "OPTurl").
+    """
+    return _filter_fields(entry_text, frozenset(f.lower() for f in excluded_fields))
+
+
+def _filter_fields(entry_text, excluded):
+    """
+    Remove fields whose lowercased name is in the excluded frozenset.
+
+    Brace depth is tracked the same way as in _iter_bib_entries, so only field
+    lines at the top level of the entry start a new field, and a field's value
+    may span lines or close its brace on a line of its own.
+    """
+    if not excluded:
+        return entry_text
+
+    parts = []
+    pos = 0  # Start of the text not yet copied to parts
+    drop_from = None  # Start of the excluded field currently being skipped
+    depth = 0
+
+    for token in _FIELD_TOKEN_RE.finditer(entry_text):
+        brace = token.group(1)
+        if brace == "{":
+            depth += 1
+            continue
+
+        if brace == "}":
+            depth -= 1
+            if depth == 0 and drop_from is not None:
+                # The entry's closing brace ends the last field; keep the
+                # whitespace (e.g., the newline) before the brace
+                value = entry_text[drop_from:token.start()]
+                parts.append(entry_text[pos:drop_from])
+                pos = drop_from + len(value.rstrip())
+                drop_from = None
+            continue
+
+        if depth != 1:
+            # A "name =" line inside a field value, not a new field
+            continue
+
+        # A new field starts here, which ends any field being skipped
+        if drop_from is not None:
+            parts.append(entry_text[pos:drop_from])
+            pos = token.start()
+            drop_from = None
+        if token.group(2).lower() in excluded:
+            drop_from = token.start()
+
+    if drop_from is not None:
+        # Unterminated entry; drop the rest of the excluded field
+        parts.append(entry_text[pos:drop_from])
+    else:
+        parts.append(entry_text[pos:])
+    return "".join(parts)
+
+
+def _iter_bib_entries(content):
     """
-    lines = entry_text.split("\n")
-    filtered_lines = []
-    
-    excluded_lower = [f.lower() for f in excluded_fields]
-    skipping = False
-
-    for line in lines:
-        # Check if line contains a field definition (e.g., "  author = {...")
-        field_match = re.match(r"^\s*(\w+)\s*=", line)
-        if field_match:
-            field_name = field_match.group(1).lower()
-            if field_name in excluded_lower:
-                skipping = True
-                continue
-            else:
-                skipping = False
-        
-        if not skipping:
-            filtered_lines.append(line)
-
-    return "\n".join(filtered_lines)
-
-
-def extract_and_filter_bib_entries(bib_file, excluded_fields):
+    Yield (key, entry_text) for each BibTeX entry in content.
+
+    Entries are delimited by tracking brace depth from the opening @type{key,
+    so nested braces and field values spanning lines are handled in a single
+    linear pass. Blocks without a key (e.g., @string, @comment) are skipped.
+    An entry whose braces never balance is skipped with a warning, and parsing
+    resumes at the next line starting with @.
+    """
+    pos = 0
+    while True:
+        start = content.find("@", pos)
+        if start == -1:
+            return
+
+        header = _ENTRY_HEAD_RE.match(content, start)
+        if header is None:
+            pos = start + 1
+            continue
+
+        # The header consumed the entry's opening brace
+        depth = 1
+        for brace in _BRACE_RE.finditer(content, header.end()):
+            depth += 1 if brace.group() == "{" else -1
+            if depth == 0:
+                end = brace.end()
+                break
+        else:
+            print(
+                f"Warning: Entry '{header.group(2)}' has unbalanced braces and was skipped"
+            )
+            resume = content.find("\n@", header.end())
+            if resume == -1:
+                return
+            pos = resume + 1
+            continue
+
+        yield header.group(2), content[start:end]
+        pos = end
+
+
+def parse_bib(bib_file, wanted_keys=None):
+    """
+    Parse a .bib file into its raw, unfiltered entries.
+
+    The result can be reused across several filtering runs so the .bib file only
+    has to be read and parsed once (e.g., by a build script that writes more
+    than one filtered bibliography).
+
+    Args:
+      bib_file (str): Path to the .bib file to be parsed.
+      wanted_keys (set, optional): Entry keys to keep. Defaults to None, which
+      keeps every entry.
+
+    Returns:
+      dict: A dictionary mapping bibliography entry keys to their raw entry text.
+    """
+    with open(bib_file, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    if wanted_keys is None:
+        return dict(_iter_bib_entries(content))
+    return {
+        key: entry_text
+        for key, entry_text in _iter_bib_entries(content)
+        if key in wanted_keys
+    }
+
+
+def extract_and_filter_bib_entries(bib_file, excluded_fields, wanted_keys=None):
     """
     Parse a .bib file and extract bibliography entries with field filtering.
 
-    This function reads a bibliography file, identifies all bibliography entries using
-    regex pattern matching, extracts their keys, and filters out unwanted fields
-    from each entry.
+    This function reads a bibliography file, identifies all bibliography entries by
+    matching their braces, extracts their keys, and filters out unwanted fields
+    from each entry. When wanted_keys is given, entries whose key is not in it
+    are discarded before filtering, so only the cited entries are kept in memory.
 
     Args:
       bib_file (str): Path to the .bib file to be parsed.
       excluded_fields (list): List of field names to exclude from the entries.
+      wanted_keys (set, optional): Entry keys to keep. Defaults to None, which
+      keeps every entry.
 
     Returns:
       dict: A dictionary where keys are bibliography entry keys and values are
@@ -134,27 +279,56 @@ def extract_and_filter_bib_entries(bib_file, excluded_fields):
     Note:
       - Expects entries to follow standard BibTeX format (@type{key, ...})
       - Uses UTF-8 encoding for file reading
-      - Relies on filter_entry_fields() function for field filtering
+      - Relies on parse_bib() for parsing and applies the same field filtering
+        as filter_entry_fields()
     """
-    with open(bib_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Lowercase the excluded fields once for the whole file
+    excluded = frozenset(f.lower() for f in excluded_fields)
+
+    return {
+        key: _filter_fields(entry_text, excluded)
+        for key, entry_text in parse_bib(bib_file, wanted_keys).items()
+    }
+
+
+def write_filtered_bib(entries, output_bib, cited_keys, excluded_fields):
+    """
+    Write the cited entries of an already parsed .bib file, with fields removed.
 
-    entries = {}
-    # Find all entries using regex
-    entry_pattern = r"(@\w+\s*\{\s*[^,\s]+\s*,.*?\n\})"
-    matches = re.finditer(entry_pattern, content, re.DOTALL | re.IGNORECASE)
+    Only the entries listed in cited_keys are filtered, so entries can be the
+    full, unfiltered result of parse_bib().
 
-    for match in matches:
-        entry_text = match.group(1)
-        # Extract the key
-        key_match = re.search(r"@\w+\s*\{\s*([^,\s]+)\s*,", entry_text)
-        if key_match:
-            key = key_match.group(1)
-            # Filter out unwanted fields
-            filtered_entry = filter_entry_fields(entry_text, excluded_fields)
-            entries[key] = filtered_entry
+    Args:
+      entries (dict): Mapping of entry keys to raw entry text, as returned by
+      parse_bib().
+      output_bib (str): Path to the output .bib file.
+      cited_keys (list): Citation keys to write, in output order.
+      excluded_fields (list): List of field names to exclude from entries.
+
+    Returns:
+      tuple: The number of entries written and a list of the cited keys that
+      were not found in entries.
+    """
+    # Lowercase the excluded fields once for the whole file
+    excluded = frozenset(f.lower() for f in excluded_fields)
+
+    out_parts = []
+    missing = []
+    filtered_count = 0
+    for key in cited_keys:
+        entry = entries.get(key)
+        if entry is not None:
+            out_parts.append(_filter_fields(entry, excluded))
+            out_parts.append("\n\n")
+            filtered_count += 1
+        else:
+            missing.append(key)
+
+    # Write all entries in one call rather than once per key
+    with open(output_bib, "w", encoding="utf-8") as f:
+        f.write("".join(out_parts))
 
-    return entries
+    return filtered_count, missing
 
 
 def filter_bib_file_manual(input_bib, output_bib, cited_keys, excluded_fields=None):
@@ -171,7 +345,7 @@ def filter_bib_file_manual(input_bib, output_bib, cited_keys, excluded_fields=No
       output_bib (str): Path to the output .bib file where filtered entries
       will be written.
       cited_keys (list): List of citation keys to include in the filtered
-      output.
+      output. A "*" key (from \\nocite{*}) includes every entry.
       excluded_fields (list, optional): List of field names to exclude from
       entries. Defaults to ["tags", "keywords", "mendeley-tags", "annote",
       "abstract", "file", "url"].
@@ -189,7 +363,7 @@ def filter_bib_file_manual(input_bib, output_bib, cited_keys, excluded_fields=No
       >>> cited_keys = ["smith2020", "jones2021", "doe2022"]
       >>> filter_bib_file_manual("references.bib", "filtered.bib",
       ...                        cited_keys)
-      Filtered 3 entries from 150 total entries
+      Filtered 3 of 3 cited entries
       Excluded fields: ['tags', 'keywords', 'mendeley-tags', 'annote',
       'abstract', 'file', 'url']
       Output written to: filtered.bib
@@ -205,18 +379,23 @@ def filter_bib_file_manual(input_bib, output_bib, cited_keys, excluded_fields=No
             "url",
         ]
 
-    entries = extract_and_filter_bib_entries(input_bib, excluded_fields)
+    if "*" in cited_keys:
+        # \nocite{*} includes every entry in the library; cited keys missing
+        # from it are still listed so they get reported
+        entries = parse_bib(input_bib)
+        cited_keys = list(entries) + [
+            key for key in cited_keys if key != "*" and key not in entries
+        ]
+    else:
+        entries = parse_bib(input_bib, frozenset(cited_keys))
+    filtered_count, missing = write_filtered_bib(
+        entries, output_bib, cited_keys, excluded_fields
+    )
 
-    with open(output_bib, "w", encoding="utf-8") as f:
-        filtered_count = 0
-        for key in cited_keys:
-            if key in entries:
-                f.write(entries[key] + "\n\n")
-                filtered_count += 1
-            else:
-                print(f"Warning: Citation key '{key}' not found in .bib file")
-
-    print(f"Filtered {filtered_count} entries from {len(entries)} total entries")
+    for key in missing:
+        print(f"Warning: Citation key '{key}' not found in .bib file")
+
+    print(f"Filtered {filtered_count} of {len(cited_keys)} cited entries")
     print(f"Excluded fields: {excluded_fields}")
     print(f"Output written to: {output_bib}")
 
@@ -2,7 +2,7 @@ import os
 import unittest
 import tempfile
 import shutil
-from academic_writing.combine_latex_sections import process_tex_file, expand_recursive
+from academic_writing.combine_latex_sections import process_tex_file, expand_recursive, convert_pagebreaks_for_pandoc
 
 class TestCombineLatexSections(unittest.TestCase):
     def setUp(self):
@@ -49,6 +49,19 @@ class TestCombineLatexSections(unittest.TestCase):
         self.assertNotIn("SHOULD_NOT_SEE_THIS", result)
         self.assertIn("SHOULD_SEE_THIS", result)
 
+    def test_stream_to_output_file(self):
+        main_path = os.path.join(self.test_dir, "main.tex")
+        out_path = os.path.join(self.test_dir, "out.tex")
+        with open(main_path, "w") as f:
+            f.write("\\begin{document}\n\\input{sub}\n\\end{document}")
+        with open(os.path.join(self.test_dir, "sub.tex"), "w") as f:
+            f.write("Sub content")
+
+        with open(out_path, "w", encoding="utf-8") as out:
+            self.assertIsNone(process_tex_file(main_path, out))
+        with open(out_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), process_tex_file(main_path))
+
     def test_multiple_inputs_on_line(self):
         content = "Text \\input{file1} and \\input{file2}"
         
@@ -64,5 +77,10 @@ class TestCombineLatexSections(unittest.TestCase):
         finally:
             cls.get_file_content = original_get
 
+    def test_convert_pagebreaks_for_pandoc(self):
+        content = "One\n\\newpage\nTwo\n\\clearpage\nThree"
+        result = convert_pagebreaks_for_pandoc(content)
+        self.assertEqual(result, "One\nPANDOCPAGEBREAK\nTwo\nPANDOCPAGEBREAK\nThree")
+
 if __name__ == "__main__":
     unittest.main()
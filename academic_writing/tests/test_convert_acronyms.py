@@ -27,6 +27,12 @@ class TestConvertAcronyms(unittest.TestCase):
         processed, _ = replace_acronyms(text, self.acronyms)
         self.assertIn("National Aeronautics and Space Administration", processed)
 
+    def test_capitalization_subsequent_use(self):
+        acronyms = {"gw": {"short": "gw", "long": "groundwater"}}
+        text = "\\ac{gw} first. \\Ac{gw} again. \\Acp{gw} too."
+        processed, _ = replace_acronyms(text, acronyms)
+        self.assertEqual(processed, "groundwater (gw) first. Gw again. Gws too.")
+
     def test_plural(self):
         text = "We use many \\acp{api}."
         processed, _ = replace_acronyms(text, self.acronyms)
@@ -64,6 +70,28 @@ class TestConvertAcronyms(unittest.TestCase):
         self.assertIn("Start with Application Programming Interface.", processed)
         self.assertIn("first call: Application Programming Interface (API)", processed)
 
+    def test_printacronyms_before_uses(self):
+        text = "\\printacronyms[include=abbrev, heading=none]\n\\ac{nasa} and \\acs{api}."
+        processed, _ = replace_acronyms(text, self.acronyms)
+        self.assertEqual(
+            processed,
+            "\\textbf{API}, Application Programming Interface\n\n"
+            "\\textbf{NASA}, National Aeronautics and Space Administration\n"
+            "National Aeronautics and Space Administration (NASA) and API.",
+        )
+
+    def test_printacronyms_option_forms(self):
+        for command in ("\\printacronyms", "\\printacronyms[heading=none]"):
+            processed, _ = replace_acronyms(f"\\acs{{api}}\n{command}\nEnd", self.acronyms)
+            self.assertEqual(
+                processed, "API\n\\textbf{API}, Application Programming Interface\nEnd"
+            )
+
+    def test_printacronyms_longer_control_word_untouched(self):
+        text = "\\acs{api} \\printacronymsX here"
+        processed, _ = replace_acronyms(text, self.acronyms)
+        self.assertEqual(processed, "API \\printacronymsX here")
+
     def test_read_acronyms_flexible(self):
         with tempfile.NamedTemporaryFile(mode='w', suffix='.tex', delete=False) as f:
             f.write("""
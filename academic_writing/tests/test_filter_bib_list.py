@@ -1,7 +1,16 @@
 import unittest
 import tempfile
 import os
-from academic_writing.filter_bib_list import extract_citations_from_tex_files, filter_entry_fields
+import io
+from contextlib import redirect_stdout
+from academic_writing.filter_bib_list import (
+    extract_citations_from_tex_files,
+    filter_entry_fields,
+    extract_and_filter_bib_entries,
+    filter_bib_file_manual,
+    parse_bib,
+    write_filtered_bib,
+)
 
 class TestFilterBibList(unittest.TestCase):
     def test_citation_extraction_variants(self):
@@ -14,10 +23,18 @@ class TestFilterBibList(unittest.TestCase):
                 \\citet{key4}
                 \\citeauthor{key5}
                 \\cite*{key6}
+                \\cite[p.~3]{key7}
+                \\citep[see][ch. 2]{key8}
+                \\parencite{key9}
+                \\Textcite{key10}
+                \\autocite[12]{key11}
+                \\footcite{key12}
+                \\nocite{key13}
+                \\nocite{*}
                 """)
             
             keys = extract_citations_from_tex_files(tmpdir)
-            expected = {"key1", "key2", "key3", "key4", "key5", "key6"}
+            expected = {f"key{i}" for i in range(1, 14)} | {"*"}
             self.assertEqual(keys, expected)
 
     def test_multi_line_field_filtering(self):
@@ -52,5 +69,187 @@ class TestFilterBibList(unittest.TestCase):
         self.assertIn("title={Title}", result)
         self.assertIn("year={2023}", result)
 
+    def test_filter_case_insensitive_any_iterable(self):
+        entry = "@misc{key,\n  URL={http://example.com},\n  year={2023}\n}"
+        for excluded in (["URL"], {"URL"}, frozenset({"URL"}), ("url",)):
+            result = filter_entry_fields(entry, excluded)
+            self.assertNotIn("example.com", result)
+            self.assertIn("year={2023}", result)
+
+    def test_filter_prefixed_and_last_fields(self):
+        entry = """@article{key,
+  title={Title},
+  OPTurl={http://example.com},
+  year={2023},
+  File={path/to/file}
+}"""
+        result = filter_entry_fields(entry, ["url", "file"])
+        self.assertEqual(result, "@article{key,\n  title={Title},\n  year={2023},\n}")
+
+    def test_filter_hyphenated_and_backslash_fields(self):
+        entry = """@misc{key,
+  note={path C:\\\\},
+  mendeley-tags={x},
+  file={a.pdf},
+  year={2023}
+}"""
+        result = filter_entry_fields(entry, ["mendeley-tags", "file"])
+        self.assertEqual(
+            result, "@misc{key,\n  note={path C:\\\\},\n  year={2023}\n}"
+        )
+
+    def test_filter_uppercase_field_not_treated_as_prefixed(self):
+        entry = "@misc{key,\n  OPTIONS={a},\n  OPTurl={b},\n  year={2023}\n}"
+        result = filter_entry_fields(entry, ["ions", "url"])
+        self.assertEqual(result, "@misc{key,\n  OPTIONS={a},\n  year={2023}\n}")
+        result = filter_entry_fields(entry, ["options"])
+        self.assertEqual(result, "@misc{key,\n  OPTurl={b},\n  year={2023}\n}")
+
+    def test_entry_parsing_nested_braces(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bib_path = os.path.join(tmpdir, "library.bib")
+            with open(bib_path, "w") as f:
+                f.write("""@string{jgr = "J. Geophys. Res."}
+
+@article{nested2020,
+  title={{The} {GPS} Study},
+  abstract={Ends with a newline
+},
+  year={2020}
+}
+@book{next2021,
+  title={Next},
+  year={2021}
+}
+""")
+            entries = extract_and_filter_bib_entries(bib_path, [])
+
+            self.assertEqual(set(entries), {"nested2020", "next2021"})
+            self.assertIn("title={{The} {GPS} Study}", entries["nested2020"])
+            self.assertIn("year={2020}", entries["nested2020"])
+            self.assertTrue(entries["nested2020"].endswith("}"))
+            self.assertNotIn("next2021", entries["nested2020"])
+
+            filtered = extract_and_filter_bib_entries(bib_path, ["abstract"])
+            self.assertEqual(
+                filtered["nested2020"],
+                "@article{nested2020,\n  title={{The} {GPS} Study},\n  year={2020}\n}",
+            )
+
+    def test_entry_parsing_recovers_from_malformed_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bib_path = os.path.join(tmpdir, "library.bib")
+            with open(bib_path, "w") as f:
+                f.write("""@misc{a,
+  note={path C:\\}
+}
+
+@misc{broken,
+  title={Stray { brace}
+}
+
+@misc{b,
+  title={B}
+}
+
+@misc{c,
+  title={C}
+}
+""")
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                entries = parse_bib(bib_path)
+
+            self.assertEqual(list(entries), ["a", "b", "c"])
+            self.assertIn("note={path C:\\}", entries["a"])
+            self.assertIn("Warning: Entry 'broken' has unbalanced braces", stdout.getvalue())
+
+    def test_filter_bib_file_manual(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bib_path = os.path.join(tmpdir, "library.bib")
+            out_path = os.path.join(tmpdir, "references.bib")
+            with open(bib_path, "w") as f:
+                f.write("""@article{smith2020,
+  title={Smith Study},
+  file={smith.pdf},
+  year={2020}
+}
+
+@book{jones2019,
+  title={Jones Book},
+  year={2019}
+}
+
+@misc{unused2018,
+  title={Never Cited},
+  year={2018}
+}
+""")
+
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                filter_bib_file_manual(
+                    bib_path, out_path, ["jones2019", "smith2020", "missing2021"], ["file"]
+                )
+
+            with open(out_path) as f:
+                result = f.read()
+
+            self.assertIn("title={Smith Study}", result)
+            self.assertIn("title={Jones Book}", result)
+            self.assertNotIn("unused2018", result)
+            self.assertNotIn("smith.pdf", result)
+            self.assertTrue(result.find("jones2019") < result.find("smith2020"))
+            self.assertIn("Warning: Citation key 'missing2021' not found", stdout.getvalue())
+
+    def test_parse_once_write_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bib_path = os.path.join(tmpdir, "library.bib")
+            with open(bib_path, "w") as f:
+                f.write("""@article{a2020,
+  title={A},
+  url={http://a},
+  year={2020}
+}
+
+@article{b2021,
+  title={B},
+  year={2021}
+}
+""")
+            entries = parse_bib(bib_path)
+            self.assertIn("url={http://a}", entries["a2020"])
+
+            out_a = os.path.join(tmpdir, "a.bib")
+            count, missing = write_filtered_bib(entries, out_a, ["a2020", "c2022"], ["URL"])
+            self.assertEqual((count, missing), (1, ["c2022"]))
+            with open(out_a) as f:
+                result = f.read()
+            self.assertIn("title={A}", result)
+            self.assertNotIn("url", result)
+            self.assertNotIn("b2021", result)
+
+            out_b = os.path.join(tmpdir, "b.bib")
+            count, missing = write_filtered_bib(entries, out_b, ["b2021"], [])
+            self.assertEqual((count, missing), (1, []))
+
+    def test_nocite_star_includes_every_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bib_path = os.path.join(tmpdir, "library.bib")
+            out_path = os.path.join(tmpdir, "references.bib")
+            with open(bib_path, "w") as f:
+                f.write("@misc{a,\n  title={A}\n}\n\n@misc{b,\n  title={B}\n}\n")
+
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                filter_bib_file_manual(bib_path, out_path, {"*", "b", "missing"}, [])
+
+            with open(out_path) as f:
+                result = f.read()
+            self.assertIn("@misc{a,", result)
+            self.assertIn("@misc{b,", result)
+            self.assertNotIn("'*'", stdout.getvalue())
+            self.assertIn("Warning: Citation key 'missing' not found", stdout.getvalue())
+
 if __name__ == "__main__":
     unittest.main()